@@ -1,18 +1,33 @@
 import streamlit as st
+from streamlit_autorefresh import st_autorefresh
+import asyncio
+import httpx
 import requests
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
+from requests.adapters import HTTPAdapter
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import functools
+import math
+import orjson
 import os
 from dotenv import load_dotenv
+from types import SimpleNamespace
 import time
-
-# Load environment variables
-load_dotenv()
+import xml.etree.ElementTree as ET
 
 # Configuration
-API_BASE_URL = os.getenv('API_URL', 'http://localhost:5000/api')
+@st.cache_resource(show_spinner=False)
+def get_config():
+    """Parse .env and the environment once per worker instead of every rerun"""
+    if os.getenv('STREAMLIT_ENV') != 'production':
+        load_dotenv()
+    return SimpleNamespace(
+        api_base_url=os.getenv('API_URL', 'http://localhost:5000/api')
+    )
+
+API_BASE_URL = get_config().api_base_url
 
 # Page config
 st.set_page_config(
@@ -23,7 +38,7 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
+_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -41,7 +56,43 @@ st.markdown("""
         margin-top: 1rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Emitted every run — Streamlit drops elements that are not re-emitted, so
+# the style block must be part of each rerun; hoisting the literal to a
+# module constant is where the saving is
+st.markdown(_CSS, unsafe_allow_html=True)
+
+# Static UI content hoisted to module constants so reruns skip re-allocation
+_NAV_OPTIONS = ("🏠 Home", "➕ New Project", "📊 View Results", "📋 Projects List")
+
+_HOME_COL1_MD = """
+#### 🔗 URL Analysis
+- Direct URL matching
+- Redirect mapping validation
+- Missing URL detection
+- Pattern change analysis
+
+#### 📈 Performance Testing
+- Lighthouse audits
+- Core Web Vitals (LCP, CLS, INP)
+- Page speed comparison
+- Before/after metrics
+"""
+
+_HOME_COL2_MD = """
+#### 🎯 SEO Validation
+- Title tag comparison
+- Meta description matching
+- H1 heading analysis
+- Canonical URL verification
+
+#### 📱 Mobile Responsiveness
+- Multi-viewport testing
+- Layout issue detection
+- Touch target validation
+- Screenshot comparison
+"""
 
 # Sidebar
 st.sidebar.title("🔍 Migration Audit Platform")
@@ -49,7 +100,7 @@ st.sidebar.markdown("---")
 
 page = st.sidebar.radio(
     "Navigation",
-    ["🏠 Home", "➕ New Project", "📊 View Results", "📋 Projects List"],
+    _NAV_OPTIONS,
     index=0
 )
 
@@ -62,22 +113,553 @@ st.sidebar.info(
 )
 
 # Helper Functions
+@st.cache_resource
+def get_session():
+    """Shared requests session with keep-alive and retries"""
+    session = requests.Session()
+    session.headers['Accept-Encoding'] = 'gzip'
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def api_request_many(endpoints):
+    """Fetch several GET endpoints concurrently, one result dict per endpoint.
+
+    The client lives and dies inside the coroutine: asyncio.run tears its
+    event loop down on return, so a client cached across calls would keep
+    pooled connections bound to a closed loop and break every later
+    fan-out. http2=True multiplexes the fan-out on one TLS connection when
+    the backend's proxy negotiates h2; HTTP/1.1 keep-alive otherwise.
+    """
+    async def _fetch_all():
+        async with httpx.AsyncClient(
+            http2=True,
+            headers={'Accept-Encoding': 'gzip'},
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            timeout=20.0
+        ) as client:
+            return await asyncio.gather(
+                *[client.get(f"{API_BASE_URL}/{endpoint}") for endpoint in endpoints],
+                return_exceptions=True
+            )
+
+    results = []
+    for response in asyncio.run(_fetch_all()):
+        if isinstance(response, Exception):
+            results.append({'success': False, 'error': str(response)})
+        else:
+            results.append(_parse_response(response))
+    return results
+
+def _parse_response(response):
+    """Decode a backend response exactly once, tolerating non-JSON error pages.
+
+    orjson decodes straight from the response bytes, skipping both stdlib
+    json and the UTF-8 decode hop — noticeable on multi-MB result payloads.
+    """
+    try:
+        body = orjson.loads(response.content) if response.content else {}
+    except orjson.JSONDecodeError:
+        body = {'error': response.text[:500]}
+
+    if response.status_code in (200, 201):
+        return {'success': True, 'data': body}
+    error = body.get('error') if isinstance(body, dict) else None
+    return {'success': False, 'error': error or f'HTTP {response.status_code}'}
+
+@functools.lru_cache(maxsize=64)
+def _api_get(endpoint):
+    """Deduplicate repeat GETs within one script run; cleared before each render"""
+    return api_request(endpoint)
+
+@st.cache_data(ttl=15, show_spinner=False)
+def api_get_cached(endpoint):
+    """Cached GET for idempotent reads; widget-driven reruns hit the cache"""
+    return _api_get(endpoint)
+
+@st.cache_resource(ttl=15, show_spinner=False)
+def fetch_project(project_id):
+    """Cached status+results fan-out for one project.
+
+    Only the results path calls this, so the multi-MB results download
+    happens on the first load of a completed project — never from the
+    status poll. cache_resource so the results dict is shared across
+    reruns instead of pickled per hit; callers treat it as read-only.
+    """
+    return api_request_many([
+        f'migration-projects/{project_id}/status',
+        f'migration-projects/{project_id}/results'
+    ])
+
+@st.cache_data(ttl=5, show_spinner=False)
+def fetch_status(project_id):
+    """Project status alone; the short TTL keeps the processing poll fresh
+    and a status refresh never re-downloads the results payload"""
+    return _api_get(f'migration-projects/{project_id}/status')
+
+@st.cache_resource(ttl=300, show_spinner=False)
+def fetch_results(project_id):
+    """Completed results payload via the concurrent fan-out; results are
+    immutable once a run finishes, so this can live much longer than the
+    status"""
+    return fetch_project(project_id)[1]
+
+def get_results_response(project_id):
+    """Results response pinned in session state, outliving the TTL caches.
+
+    Only successful responses are pinned, so a failed fetch is retried on
+    the next rerun instead of being stuck for the session.
+    """
+    key = f'results_{project_id}'
+    cached = st.session_state.get(key)
+    if cached is None:
+        cached = fetch_results(project_id)
+        if cached['success']:
+            st.session_state[key] = cached
+    return cached
+
+@st.cache_resource
+def get_executor():
+    """Background executor so long uploads don't block the script thread"""
+    return ThreadPoolExecutor(max_workers=2)
+
+def validate_sitemap(upload):
+    """Streaming XML well-formedness check; returns an error string or None.
+
+    iterparse walks the upload in O(1) memory, so malformed sitemaps are
+    caught locally instead of after a full round-trip to the backend.
+    """
+    upload.seek(0)
+    try:
+        for _ in ET.iterparse(upload, events=('end',)):
+            pass
+    except ET.ParseError as e:
+        return str(e)
+    finally:
+        upload.seek(0)
+    return None
+
+def create_and_start_project(fields, progress):
+    """Worker: upload the project files, then kick off processing.
+
+    progress is a plain dict the worker mutates so the script thread can
+    report the current step while it waits on the future.
+    """
+    progress['step'] = 'Uploading project files'
+    encoder = MultipartEncoder(fields=fields)
+    create_response = api_request(
+        'migration-projects',
+        method='POST',
+        data=encoder,
+        headers={'Content-Type': encoder.content_type}
+    )
+    if not create_response['success']:
+        return {'success': False, 'error': f"Failed to create project: {create_response['error']}"}
+
+    project_id = create_response['data']['project']['_id']
+    progress['step'] = 'Starting processing'
+    process_response = api_request(f'migration-projects/{project_id}/process', method='POST')
+    if not process_response['success']:
+        return {
+            'success': False,
+            'error': f"Failed to start processing: {process_response['error']}",
+            'project_id': project_id
+        }
+    return {'success': True, 'project_id': project_id}
+
+@st.cache_data(ttl=600, show_spinner=False)
+def get_export(project_id, fmt, section):
+    """Export bytes, fetched once per (project, format, section)"""
+    response = get_session().get(
+        f"{API_BASE_URL}/migration-projects/{project_id}/export",
+        params={'format': fmt, 'section': section},
+        timeout=60
+    )
+    response.raise_for_status()
+    return response.content
+
+def get_project_meta(project_id, status=None):
+    """Per-session cache of a project's immutable fields (name, base URLs).
+
+    Status is mutable and stays on the fetch path; the metadata survives
+    page switches in st.session_state so repeat visits render it without
+    depending on another round-trip.
+    """
+    cache = st.session_state.setdefault('projects_cache', {})
+    if project_id not in cache and status is not None:
+        cache[project_id] = {
+            'projectName': status.get('projectName', 'N/A'),
+            'oldBaseUrl': status.get('oldBaseUrl', 'N/A'),
+            'newBaseUrl': status.get('newBaseUrl', 'N/A')
+        }
+    return cache.get(project_id, {})
+
+def _results_section(project_id, section):
+    """One section of the results payload, or None when unavailable.
+
+    Goes through the session-pinned response, so chart and table builders
+    render the same snapshot as the fragments and summary text around
+    them even after the TTL caches expire.
+    """
+    results_response = get_results_response(project_id)
+    if not results_response['success']:
+        return None
+    return results_response['data']['results'].get(section)
+
+@st.cache_resource(ttl=60)
+def get_url_comparison_df(project_id, section):
+    """URL-comparison detail rows as a shared DataFrame.
+
+    cache_resource rather than cache_data on purpose: cache_data would
+    pickle+unpickle the whole frame on every hit. The returned frame is
+    shared across reruns, so callers must .copy() before mutating it.
+    """
+    comparison = _results_section(project_id, 'urlComparison') or {}
+    return pd.DataFrame(comparison.get(section, []))
+
+# Shared Plotly layouts hoisted to module constants: builders hand them to
+# the figure constructor instead of re-allocating literal dicts per build
+_URL_LAYOUT = dict(title="URL Status Distribution", showlegend=False, height=300, uirevision='url')
+_PERF_LAYOUT = dict(barmode='group', xaxis_tickangle=-45, yaxis=dict(range=[0, 100]), height=500, uirevision='perf')
+_SEO_LAYOUT = dict(xaxis_tickangle=-45, height=500, uirevision='seo')
+_MOBILE_LAYOUT = dict(title="Mobile Responsiveness Comparison", barmode='group', height=400, uirevision='mobile')
+
+@st.cache_resource(ttl=300)
+def get_seo_details_df(project_id, limit=50):
+    """SEO detail table built once per project.
+
+    Keyed on the project id at the fetch layer, so the raw results dict is
+    never hashed and reruns reuse the finished frame instead of
+    re-flattening the comparisons.
+    """
+    seo = _results_section(project_id, 'seoValidation') or {}
+    comparisons = seo.get('comparisons', [])[:limit]
+    if not comparisons:
+        return pd.DataFrame()
+    flat = pd.json_normalize(comparisons)
+    return pd.DataFrame({
+        'URL': flat['oldUrl'],
+        'Match Score': flat['matchScore'].astype(str) + '%',
+        'Title Match': np.where(flat['title.match'], '✅', '❌'),
+        'Desc Match': np.where(flat['description.match'], '✅', '❌'),
+        'H1 Match': np.where(flat['h1.match'], '✅', '❌'),
+        'Severity': flat['severity']
+    })
+
+def _truncate_urls(series, width):
+    """Vectorized URL shortening for axis labels; .str ops run in C instead
+    of a Python branch and slice per row"""
+    urls = series.astype('string')
+    return urls.where(urls.str.len() <= width, urls.str.slice(0, width) + '...')
+
+# Figure builders are cached per project: Plotly figure construction and
+# validation is CPU-heavy, so reruns reuse the built object
+@st.cache_resource(ttl=60)
+def build_url_distribution_chart(project_id):
+    """Horizontal bar of matched/redirected/missing/new URL counts.
+
+    A bar skips the pie's outside-label leader-line layout, the dominant
+    client-side cost for small SVG pies; the summary column next to the
+    chart already lists the exact percentages.
+    """
+    comparison = _results_section(project_id, 'urlComparison')
+    if not comparison:
+        return None
+    url_data = comparison['summary']
+    counts = [
+        url_data.get('matchedCount', 0),
+        url_data.get('redirectedCount', 0),
+        url_data.get('missingCount', 0),
+        len(comparison.get('newOnly', []))
+    ]
+    fig = go.Figure(data=[go.Bar(
+        x=counts,
+        y=['Matched', 'Redirected', 'Missing', 'New'],
+        orientation='h',
+        marker_color=['#10b981', '#f59e0b', '#ef4444', '#3b82f6'],
+        text=counts,
+        textposition='outside'
+    )], layout=_URL_LAYOUT)
+    return fig
+
+@st.cache_resource(ttl=60)
+def build_performance_chart(project_id, limit=10):
+    """Old-vs-new Lighthouse score bars for the most-changed URLs"""
+    perf = _results_section(project_id, 'performanceValidation') or {}
+    comparisons = perf.get('comparisons', [])
+    # Chart the biggest score swings rather than an arbitrary head slice
+    perf_data = sorted(comparisons, key=lambda p: abs(p['scoreDelta']), reverse=True)[:limit]
+    if not perf_data:
+        return None
+    # json_normalize builds the columns directly in C; the URL truncation is
+    # a vectorized .str pass instead of a Python branch per row
+    df = pd.json_normalize(perf_data)[['url', 'oldScore', 'newScore', 'scoreDelta']].rename(
+        columns={'oldScore': 'Old Score', 'newScore': 'New Score', 'scoreDelta': 'Delta'}
+    )
+    df['URL'] = _truncate_urls(df['url'], 30)
+    fig = go.Figure(layout=_PERF_LAYOUT)
+    fig.add_trace(go.Bar(
+        name='Old Site',
+        x=df['URL'],
+        y=df['Old Score'],
+        marker_color='#ef4444',
+        text=df['Old Score'],
+        textposition='outside'
+    ))
+    fig.add_trace(go.Bar(
+        name='New Site',
+        x=df['URL'],
+        y=df['New Score'],
+        marker_color='#10b981',
+        text=df['New Score'],
+        textposition='outside'
+    ))
+    fig.update_layout(title=f"Performance Scores Comparison (Top {len(perf_data)} URLs by score change)")
+    return fig
+
+@st.cache_resource(ttl=60)
+def build_seo_chart(project_id, limit=15):
+    """SEO match-score bars for the URLs that need the most attention"""
+    # Only consumer of plotly.express; importing here keeps its ~200ms load
+    # off the results page until this chart is actually built
+    import plotly.express as px
+
+    seo = _results_section(project_id, 'seoValidation') or {}
+    comparisons = seo.get('comparisons', [])
+    seo_data = sorted(comparisons, key=lambda s: s['matchScore'])[:limit]
+    if not seo_data:
+        return None
+    df = pd.json_normalize(seo_data)[['oldUrl', 'matchScore', 'severity']].rename(
+        columns={'matchScore': 'Match Score', 'severity': 'Severity'}
+    )
+    df['URL'] = _truncate_urls(df['oldUrl'], 40)
+    fig = px.bar(
+        df,
+        x='URL',
+        y='Match Score',
+        color='Match Score',
+        color_continuous_scale='RdYlGn',
+        range_color=[0, 100],
+        title=f"SEO Match Scores (Lowest {len(seo_data)} URLs)",
+        text='Match Score'
+    )
+    fig.update_layout(**_SEO_LAYOUT)
+    fig.update_traces(texttemplate='%{text:.0f}', textposition='outside')
+    return fig
+
+@st.cache_resource(ttl=60)
+def build_mobile_chart(project_id):
+    """Old-vs-new mobile responsiveness breakdown"""
+    mobile = _results_section(project_id, 'mobileResponsiveness')
+    if not mobile:
+        return None
+    mobile_data = mobile['summary']
+    categories = ['Fully Responsive', 'Minor Issues', 'Major Issues']
+    old_values = [
+        mobile_data['old'].get('fullyResponsive', 0),
+        mobile_data['old'].get('hasMinorIssues', 0),
+        mobile_data['old'].get('hasMajorIssues', 0)
+    ]
+    new_values = [
+        mobile_data['new'].get('fullyResponsive', 0),
+        mobile_data['new'].get('hasMinorIssues', 0),
+        mobile_data['new'].get('hasMajorIssues', 0)
+    ]
+    # One-shot constructor: each add_trace call runs its own schema
+    # validation pass, passing data= validates both bars at once
+    return go.Figure(data=[
+        go.Bar(
+            name='Old Site',
+            x=categories,
+            y=old_values,
+            marker_color='#ef4444',
+            text=old_values,
+            textposition='outside'
+        ),
+        go.Bar(
+            name='New Site',
+            x=categories,
+            y=new_values,
+            marker_color='#10b981',
+            text=new_values,
+            textposition='outside'
+        )
+    ], layout=_MOBILE_LAYOUT)
+
+def render_metric_row(metrics):
+    """Emit a row of metric cards as one markdown call.
+
+    Each st.metric/st.columns call is a separate ForwardMsg to the
+    frontend; packing the row into a single HTML grid sends one.
+    metrics is a list of (label, value, delta_text, delta_color) tuples.
+    """
+    cells = ''.join(
+        "<div class='metric-card' style='flex: 1;'>"
+        f"<div style='font-size: 0.85rem; color: #64748b;'>{label}</div>"
+        f"<div style='font-size: 1.6rem; font-weight: bold;'>{value}</div>"
+        f"<div style='font-size: 0.85rem; color: {delta_color};'>{delta}</div>"
+        "</div>"
+        for label, value, delta, delta_color in metrics
+    )
+    st.markdown(
+        f"<div style='display: flex; gap: 1rem;'>{cells}</div>",
+        unsafe_allow_html=True
+    )
+
+# Each visualization tab is a fragment: widget events inside one tab (the
+# chart-size sliders, for instance) rerun only that fragment instead of
+# re-executing the whole page and re-serializing the other three figures
+@st.fragment
+def render_url_tab(project_id, results):
+    if results.get('urlComparison'):
+        url_data = results['urlComparison']['summary']
+
+        col_a, col_b = st.columns([2, 1])
+
+        with col_a:
+            st.plotly_chart(build_url_distribution_chart(project_id), use_container_width=True)
+
+        with col_b:
+            st.markdown("#### Summary")
+            st.markdown(f"""
+            - **Total Old URLs**: {url_data.get('totalOldUrls', 0):,}
+            - **Total New URLs**: {url_data.get('totalNewUrls', 0):,}
+            - **Match Rate**: {url_data.get('matchRate', 0):.1f}%
+            - **Matched**: {url_data.get('matchedCount', 0):,}
+            - **Redirected**: {url_data.get('redirectedCount', 0):,}
+            - **Missing**: {url_data.get('missingCount', 0):,}
+            """)
+
+@st.fragment
+def render_performance_tab(project_id, results):
+    if results.get('performanceValidation'):
+        perf_all = results['performanceValidation'].get('comparisons', [])
+        perf_data = perf_all[:10]
+
+        if perf_data:
+            perf_limit = 10
+            if len(perf_all) > 10:
+                perf_limit = st.slider(
+                    "URLs to chart",
+                    min_value=5,
+                    max_value=min(len(perf_all), 100),
+                    value=10,
+                    step=5,
+                    key='perf_chart_limit'
+                )
+            st.plotly_chart(build_performance_chart(project_id, perf_limit), use_container_width=True)
+
+            st.markdown("#### Core Web Vitals")
+
+            # Prefer averages the backend materialized once per project;
+            # fall back to reducing the row-level data client-side
+            avg_cwv = results['performanceValidation'].get('summary', {}).get('avgCoreWebVitals')
+            if avg_cwv:
+                avg_lcp_old, avg_lcp_new = avg_cwv['lcp']['old'], avg_cwv['lcp']['new']
+                avg_cls_old, avg_cls_new = avg_cwv['cls']['old'], avg_cwv['cls']['new']
+                avg_inp_old, avg_inp_new = avg_cwv['inp']['old'], avg_cwv['inp']['new']
+            else:
+                cwv_means = pd.json_normalize(perf_data)[[
+                    'coreWebVitals.lcp.old', 'coreWebVitals.lcp.new',
+                    'coreWebVitals.cls.old', 'coreWebVitals.cls.new',
+                    'coreWebVitals.inp.old', 'coreWebVitals.inp.new'
+                ]].mean()
+                (avg_lcp_old, avg_lcp_new,
+                 avg_cls_old, avg_cls_new,
+                 avg_inp_old, avg_inp_new) = cwv_means
+
+            # Lower is better for all three vitals, so increases render red
+            render_metric_row([
+                ("Avg LCP", f"{avg_lcp_new:.0f}ms", f"{avg_lcp_new - avg_lcp_old:+.0f}ms",
+                 '#ef4444' if avg_lcp_new > avg_lcp_old else '#10b981'),
+                ("Avg CLS", f"{avg_cls_new:.3f}", f"{avg_cls_new - avg_cls_old:+.3f}",
+                 '#ef4444' if avg_cls_new > avg_cls_old else '#10b981'),
+                ("Avg INP", f"{avg_inp_new:.0f}ms", f"{avg_inp_new - avg_inp_old:+.0f}ms",
+                 '#ef4444' if avg_inp_new > avg_inp_old else '#10b981')
+            ])
+
+@st.fragment
+def render_seo_tab(project_id, results):
+    if results.get('seoValidation'):
+        seo_all = results['seoValidation'].get('comparisons', [])
+        seo_data = seo_all[:15]
+
+        if seo_data:
+            seo_limit = 15
+            if len(seo_all) > 15:
+                seo_limit = st.slider(
+                    "URLs to chart",
+                    min_value=5,
+                    max_value=min(len(seo_all), 100),
+                    value=15,
+                    step=5,
+                    key='seo_chart_limit'
+                )
+            st.plotly_chart(build_seo_chart(project_id, seo_limit), use_container_width=True)
+
+            # Prefer the distribution the backend materialized over all
+            # comparisons; fall back to bucketing the charted rows here
+            distribution = results['seoValidation'].get('summary', {}).get('distribution')
+            if distribution:
+                perfect = distribution.get('perfect', 0)
+                good = distribution.get('good', 0)
+                needs_work = distribution.get('needsWork', 0)
+            else:
+                scores = pd.json_normalize(seo_data)['matchScore'].to_numpy()
+                perfect = int((scores >= 95).sum())
+                good = int(((scores >= 80) & (scores < 95)).sum())
+                needs_work = int((scores < 80).sum())
+            total = perfect + good + needs_work
+
+            sum_col1, sum_col2, sum_col3 = st.columns(3)
+            with sum_col1:
+                st.metric("Perfect Matches", f"{perfect}/{total}")
+            with sum_col2:
+                st.metric("Good Matches", f"{good}/{total}")
+            with sum_col3:
+                st.metric("Needs Work", f"{needs_work}/{total}")
+
+@st.fragment
+def render_mobile_tab(project_id, results):
+    if results.get('mobileResponsiveness'):
+        mobile_data = results['mobileResponsiveness']['summary']
+
+        st.plotly_chart(build_mobile_chart(project_id), use_container_width=True)
+
+        # Mobile insights
+        st.markdown("#### Mobile Insights")
+        if mobile_data.get('improved', 0) > 0:
+            st.success(f"✅ {mobile_data['improved']} pages improved in mobile responsiveness")
+        if mobile_data.get('regressed', 0) > 0:
+            st.warning(f"⚠️ {mobile_data['regressed']} pages regressed in mobile responsiveness")
+
 def api_request(endpoint, method='GET', **kwargs):
     """Make API request with error handling"""
     try:
         url = f"{API_BASE_URL}/{endpoint}"
+        session = get_session()
+        timeout = kwargs.pop('timeout', 15)
         if method == 'GET':
-            response = requests.get(url, **kwargs)
+            response = session.get(url, timeout=timeout, **kwargs)
         elif method == 'POST':
-            response = requests.post(url, **kwargs)
-        
-        if response.status_code in [200, 201]:
-            return {'success': True, 'data': response.json()}
-        else:
-            return {'success': False, 'error': response.json().get('error', 'Unknown error')}
-    except Exception as e:
+            response = session.post(url, timeout=timeout, **kwargs)
+
+        return _parse_response(response)
+    except requests.Timeout:
+        return {'success': False, 'error': 'Backend timeout', 'retryable': True}
+    except requests.ConnectionError:
+        return {'success': False, 'error': 'Backend unreachable', 'retryable': True}
+    except requests.RequestException as e:
         return {'success': False, 'error': str(e)}
 
+# Scope the GET dedupe cache to the rerun about to render
+_api_get.cache_clear()
+
 # ==========================================
 # HOME PAGE
 # ==========================================
@@ -96,34 +678,10 @@ if page == "🏠 Home":
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("""
-        #### 🔗 URL Analysis
-        - Direct URL matching
-        - Redirect mapping validation
-        - Missing URL detection
-        - Pattern change analysis
-        
-        #### 📈 Performance Testing
-        - Lighthouse audits
-        - Core Web Vitals (LCP, CLS, INP)
-        - Page speed comparison
-        - Before/after metrics
-        """)
-    
+        st.markdown(_HOME_COL1_MD)
+
     with col2:
-        st.markdown("""
-        #### 🎯 SEO Validation
-        - Title tag comparison
-        - Meta description matching
-        - H1 heading analysis
-        - Canonical URL verification
-        
-        #### 📱 Mobile Responsiveness
-        - Multi-viewport testing
-        - Layout issue detection
-        - Touch target validation
-        - Screenshot comparison
-        """)
+        st.markdown(_HOME_COL2_MD)
     
     st.markdown("---")
     st.markdown("### Getting Started")
@@ -217,98 +775,145 @@ elif page == "➕ New Project":
             if not all([project_name, old_url, new_url, old_sitemap, new_sitemap]):
                 st.error("⚠️ Please fill all required fields (*) and upload both sitemaps")
             else:
-                with st.spinner("Creating project and starting analysis..."):
-                    # Prepare files
-                    files = {
-                        'oldSitemap': ('old-sitemap.xml', old_sitemap, 'application/xml'),
-                        'newSitemap': ('new-sitemap.xml', new_sitemap, 'application/xml'),
-                    }
-                    
-                    if gsc_export:
-                        files['gscExport'] = ('gsc-export.csv', gsc_export, 'text/csv')
-                    if redirects:
-                        files['redirectMapping'] = ('redirects.csv', redirects, 'text/csv')
-                    
-                    # Prepare data
-                    data = {
-                        'projectName': project_name,
-                        'description': description,
-                        'oldBaseUrl': old_url,
-                        'newBaseUrl': new_url
-                    }
-                    
-                    # Create project
-                    create_response = api_request('migration-projects', method='POST', files=files, data=data)
-                    
-                    if create_response['success']:
-                        project = create_response['data']['project']
-                        project_id = project['_id']
-                        
-                        st.success(f"✅ Project created successfully!")
-                        st.info(f"**Project ID**: `{project_id}`")
-                        
-                        # Start processing
-                        process_response = api_request(f'migration-projects/{project_id}/process', method='POST')
-                        
-                        if process_response['success']:
-                            st.success("🚀 Analysis started! Processing will take approximately 15-25 minutes.")
-                            st.balloons()
-                            
-                            # Save to session state
-                            st.session_state['current_project_id'] = project_id
-                            st.session_state['project_name'] = project_name
-                            
-                            st.markdown("---")
-                            st.markdown("### Next Steps:")
-                            st.markdown(f"""
-                            1. **Copy your Project ID**: `{project_id}`
-                            2. Go to **📊 View Results** page
-                            3. Enter your Project ID to track progress
-                            4. Refresh periodically to see real-time updates
-                            """)
-                            
-                            if st.button("📊 Go to Results Page"):
-                                st.rerun()
-                        else:
-                            st.error(f"❌ Failed to start processing: {process_response['error']}")
+                # Reject malformed XML locally before spending an upload on it
+                for label, upload in (('Old', old_sitemap), ('New', new_sitemap)):
+                    parse_error = validate_sitemap(upload)
+                    if parse_error:
+                        st.error(f"⚠️ {label} sitemap is not valid XML: {parse_error}")
+                        st.stop()
+
+                # Build a streaming multipart body so large sitemaps are
+                # chunked straight from the upload buffer to the socket
+                fields = {
+                    'projectName': project_name,
+                    'description': description,
+                    'oldBaseUrl': old_url,
+                    'newBaseUrl': new_url,
+                    'oldSitemap': ('old-sitemap.xml', old_sitemap, 'application/xml'),
+                    'newSitemap': ('new-sitemap.xml', new_sitemap, 'application/xml'),
+                }
+
+                if gsc_export:
+                    fields['gscExport'] = ('gsc-export.csv', gsc_export, 'text/csv')
+                if redirects:
+                    fields['redirectMapping'] = ('redirects.csv', redirects, 'text/csv')
+
+                for upload in [old_sitemap, new_sitemap, gsc_export, redirects]:
+                    if upload:
+                        upload.seek(0)
+
+                # Run the upload + process kick-off on a worker thread and
+                # report its current step + elapsed time while it streams
+                progress = {'step': 'Uploading project files'}
+                future = get_executor().submit(create_and_start_project, fields, progress)
+
+                with st.status("🚀 Uploading files and starting analysis...", expanded=True) as submit_status:
+                    step_line = st.empty()
+                    started = time.monotonic()
+                    while not future.done():
+                        elapsed = time.monotonic() - started
+                        step_line.write(f"{progress['step']}… {elapsed:.0f}s elapsed")
+                        time.sleep(0.3)
+                    step_line.empty()
+                    outcome = future.result()
+
+                    if outcome['success']:
+                        submit_status.update(label="✅ Project created and analysis started", state="complete")
                     else:
-                        st.error(f"❌ Failed to create project: {create_response['error']}")
+                        submit_status.update(label="❌ Submission failed", state="error")
+
+                if outcome['success']:
+                    project_id = outcome['project_id']
+
+                    st.success(f"✅ Project created successfully!")
+                    st.info(f"**Project ID**: `{project_id}`")
+                    st.success("🚀 Analysis started! Processing will take approximately 15-25 minutes.")
+                    st.balloons()
+
+                    # Save to session state
+                    st.session_state['current_project_id'] = project_id
+                    st.session_state['project_name'] = project_name
+
+                    st.markdown("---")
+                    st.markdown("### Next Steps:")
+                    st.markdown(f"""
+                    1. **Copy your Project ID**: `{project_id}`
+                    2. Go to **📊 View Results** page
+                    3. Enter your Project ID to track progress
+                    4. Refresh periodically to see real-time updates
+                    """)
+
+                    if st.button("📊 Go to Results Page"):
+                        st.rerun()
+                else:
+                    st.error(f"❌ {outcome['error']}")
 
 # ==========================================
 # VIEW RESULTS PAGE
 # ==========================================
 elif page == "📊 View Results":
+    # Heavy imports deferred to the page that needs them; first call pays the
+    # import cost, later reruns hit sys.modules for free
+    import numpy as np
+    import pandas as pd
+    import plotly.graph_objects as go
+
     st.markdown('<p class="main-header">Migration Audit Results</p>', unsafe_allow_html=True)
     
-    # Project ID input
-    col1, col2 = st.columns([3, 1])
-    with col1:
-        project_id = st.text_input(
-            "Enter Project ID",
-            value=st.session_state.get('current_project_id', ''),
-            placeholder="Enter your project ID here",
-            help="The ID you received when creating the project"
-        )
-    with col2:
-        st.markdown("<br>", unsafe_allow_html=True)
-        load_btn = st.button("🔄 Load Results", type="primary", use_container_width=True)
-    
-    if (load_btn or project_id) and project_id:
-        # Fetch project status
-        status_response = api_request(f'migration-projects/{project_id}/status')
+    # Project ID input — the form batches keystrokes so the backend is only
+    # hit on explicit submit, not once per typed character
+    with st.form("load_project"):
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            entered_id = st.text_input(
+                "Enter Project ID",
+                value=st.session_state.get('current_project_id', ''),
+                placeholder="Enter your project ID here",
+                help="The ID you received when creating the project"
+            )
+        with col2:
+            st.markdown("<br>", unsafe_allow_html=True)
+            load_btn = st.form_submit_button("🔄 Load Results", type="primary", use_container_width=True)
+
+    if load_btn and entered_id:
+        st.session_state['current_project_id'] = entered_id
+
+    project_id = st.session_state.get('current_project_id', '')
+
+    if project_id:
+        # An explicit load busts the caches; plain reruns reuse them until the TTL
+        if load_btn:
+            fetch_project.clear()
+            fetch_status.clear()
+            fetch_results.clear()
+            st.session_state.pop(f'results_{project_id}', None)
+            st.session_state.setdefault('projects_cache', {}).pop(project_id, None)
+            for stale_key in [k for k in st.session_state if k.startswith(f'export_{project_id}_')]:
+                del st.session_state[stale_key]
+            get_url_comparison_df.clear()
+            get_seo_details_df.clear()
+            build_url_distribution_chart.clear()
+            build_performance_chart.clear()
+            build_seo_chart.clear()
+            build_mobile_chart.clear()
+
+        # Status is a cheap single GET; the status+results fan-out only runs
+        # once the project is completed and the results path needs it
+        status_response = fetch_status(project_id)
         
         if status_response['success']:
             status = status_response['data']
             
-            # Display project info
+            # Display project info (immutable fields come from the session cache)
+            meta = get_project_meta(project_id, status)
             st.markdown("### Project Information")
             info_col1, info_col2 = st.columns(2)
             with info_col1:
-                st.markdown(f"**Project Name**: {status.get('projectName', 'N/A')}")
-                st.markdown(f"**Old Site**: {status.get('oldBaseUrl', 'N/A')}")
+                st.markdown(f"**Project Name**: {meta.get('projectName', 'N/A')}")
+                st.markdown(f"**Old Site**: {meta.get('oldBaseUrl', 'N/A')}")
             with info_col2:
                 st.markdown(f"**Status**: {status['status'].upper()}")
-                st.markdown(f"**New Site**: {status.get('newBaseUrl', 'N/A')}")
+                st.markdown(f"**New Site**: {meta.get('newBaseUrl', 'N/A')}")
             
             st.markdown("---")
             
@@ -339,60 +944,38 @@ elif page == "📊 View Results":
             # If completed, show full results
             if status['status'] == 'completed':
                 st.markdown("---")
-                
-                # Fetch full results
-                results_response = api_request(f'migration-projects/{project_id}/results')
-                
+
+                results_response = get_results_response(project_id)
+
                 if results_response['success']:
                     data = results_response['data']
                     results = data['results']
                     
                     # === OVERVIEW METRICS ===
                     st.markdown("## 📊 Overview")
-                    
-                    metric_col1, metric_col2, metric_col3, metric_col4 = st.columns(4)
-                    
-                    with metric_col1:
-                        url_summary = results.get('urlComparison', {}).get('summary', {})
-                        total_urls = url_summary.get('totalOldUrls', 0)
-                        match_rate = url_summary.get('matchRate', 0)
-                        st.metric(
-                            "Total URLs",
-                            f"{total_urls:,}",
-                            delta=f"{match_rate}% matched",
-                            delta_color="normal"
-                        )
-                    
-                    with metric_col2:
-                        perf_summary = results.get('performanceValidation', {}).get('summary', {})
-                        new_score = perf_summary.get('avgScoreNew', 0)
-                        score_delta = perf_summary.get('avgScoreDelta', 0)
-                        st.metric(
-                            "Avg Performance",
-                            f"{new_score}/100",
-                            delta=f"{score_delta:+.0f} points",
-                            delta_color="normal" if score_delta >= 0 else "inverse"
-                        )
-                    
-                    with metric_col3:
-                        seo_summary = results.get('seoValidation', {}).get('summary', {})
-                        seo_score = seo_summary.get('avgMatchScore', 0)
-                        st.metric(
-                            "SEO Health",
-                            f"{seo_score:.0f}%",
-                            delta="Match score"
-                        )
-                    
-                    with metric_col4:
-                        mobile_summary = results.get('mobileResponsiveness', {}).get('summary', {})
-                        new_mobile = mobile_summary.get('new', {})
-                        responsive = new_mobile.get('fullyResponsive', 0)
-                        total_tested = new_mobile.get('totalTested', 0)
-                        st.metric(
-                            "Mobile Ready",
-                            f"{responsive}/{total_tested}",
-                            delta=f"{(responsive/total_tested*100) if total_tested > 0 else 0:.0f}% responsive"
-                        )
+
+                    url_summary = results.get('urlComparison', {}).get('summary', {})
+                    perf_summary = results.get('performanceValidation', {}).get('summary', {})
+                    seo_summary = results.get('seoValidation', {}).get('summary', {})
+                    mobile_summary = results.get('mobileResponsiveness', {}).get('summary', {})
+
+                    total_urls = url_summary.get('totalOldUrls', 0)
+                    match_rate = url_summary.get('matchRate', 0)
+                    new_score = perf_summary.get('avgScoreNew', 0)
+                    score_delta = perf_summary.get('avgScoreDelta', 0)
+                    seo_score = seo_summary.get('avgMatchScore', 0)
+                    new_mobile = mobile_summary.get('new', {})
+                    responsive = new_mobile.get('fullyResponsive', 0)
+                    total_tested = new_mobile.get('totalTested', 0)
+                    responsive_rate = (responsive / total_tested * 100) if total_tested > 0 else 0
+
+                    render_metric_row([
+                        ("Total URLs", f"{total_urls:,}", f"{match_rate}% matched", '#10b981'),
+                        ("Avg Performance", f"{new_score}/100", f"{score_delta:+.0f} points",
+                         '#10b981' if score_delta >= 0 else '#ef4444'),
+                        ("SEO Health", f"{seo_score:.0f}%", "Match score", '#64748b'),
+                        ("Mobile Ready", f"{responsive}/{total_tested}", f"{responsive_rate:.0f}% responsive", '#10b981')
+                    ])
                     
                     st.markdown("---")
                     
@@ -407,198 +990,16 @@ elif page == "📊 View Results":
                     ])
                     
                     with tab1:
-                        if results.get('urlComparison'):
-                            url_data = results['urlComparison']['summary']
-                            
-                            col_a, col_b = st.columns([2, 1])
-                            
-                            with col_a:
-                                # Pie chart
-                                fig = go.Figure(data=[go.Pie(
-                                    labels=['Matched', 'Redirected', 'Missing', 'New'],
-                                    values=[
-                                        url_data.get('matchedCount', 0),
-                                        url_data.get('redirectedCount', 0),
-                                        url_data.get('missingCount', 0),
-                                        len(results['urlComparison'].get('newOnly', []))
-                                    ],
-                                    marker=dict(colors=['#10b981', '#f59e0b', '#ef4444', '#3b82f6']),
-                                    hole=0.4,
-                                    textinfo='label+percent+value',
-                                    textposition='outside'
-                                )])
-                                fig.update_layout(
-                                    title="URL Status Distribution",
-                                    height=400
-                                )
-                                st.plotly_chart(fig, use_container_width=True)
-                            
-                            with col_b:
-                                st.markdown("#### Summary")
-                                st.markdown(f"""
-                                - **Total Old URLs**: {url_data.get('totalOldUrls', 0):,}
-                                - **Total New URLs**: {url_data.get('totalNewUrls', 0):,}
-                                - **Match Rate**: {url_data.get('matchRate', 0):.1f}%
-                                - **Matched**: {url_data.get('matchedCount', 0):,}
-                                - **Redirected**: {url_data.get('redirectedCount', 0):,}
-                                - **Missing**: {url_data.get('missingCount', 0):,}
-                                """)
-                    
+                        render_url_tab(project_id, results)
+
                     with tab2:
-                        if results.get('performanceValidation'):
-                            perf_data = results['performanceValidation'].get('comparisons', [])[:10]
-                            
-                            if perf_data:
-                                df = pd.DataFrame([
-                                    {
-                                        'URL': p['url'][:30] + '...' if len(p['url']) > 30 else p['url'],
-                                        'Old Score': p['oldScore'],
-                                        'New Score': p['newScore'],
-                                        'Delta': p['scoreDelta']
-                                    }
-                                    for p in perf_data
-                                ])
-                                
-                                fig = go.Figure()
-                                fig.add_trace(go.Bar(
-                                    name='Old Site',
-                                    x=df['URL'],
-                                    y=df['Old Score'],
-                                    marker_color='#ef4444',
-                                    text=df['Old Score'],
-                                    textposition='outside'
-                                ))
-                                fig.add_trace(go.Bar(
-                                    name='New Site',
-                                    x=df['URL'],
-                                    y=df['New Score'],
-                                    marker_color='#10b981',
-                                    text=df['New Score'],
-                                    textposition='outside'
-                                ))
-                                fig.update_layout(
-                                    title="Performance Scores Comparison (Top 10 URLs)",
-                                    barmode='group',
-                                    xaxis_tickangle=-45,
-                                    yaxis=dict(range=[0, 100]),
-                                    height=500
-                                )
-                                st.plotly_chart(fig, use_container_width=True)
-                                
-                                # Core Web Vitals
-                                st.markdown("#### Core Web Vitals")
-                                cwv_col1, cwv_col2, cwv_col3 = st.columns(3)
-                                
-                                avg_lcp_old = sum(p['coreWebVitals']['lcp']['old'] for p in perf_data) / len(perf_data)
-                                avg_lcp_new = sum(p['coreWebVitals']['lcp']['new'] for p in perf_data) / len(perf_data)
-                                
-                                with cwv_col1:
-                                    st.metric("Avg LCP", f"{avg_lcp_new:.0f}ms", delta=f"{avg_lcp_new - avg_lcp_old:.0f}ms", delta_color="inverse")
-                                
-                                avg_cls_old = sum(p['coreWebVitals']['cls']['old'] for p in perf_data) / len(perf_data)
-                                avg_cls_new = sum(p['coreWebVitals']['cls']['new'] for p in perf_data) / len(perf_data)
-                                
-                                with cwv_col2:
-                                    st.metric("Avg CLS", f"{avg_cls_new:.3f}", delta=f"{avg_cls_new - avg_cls_old:.3f}", delta_color="inverse")
-                                
-                                avg_inp_old = sum(p['coreWebVitals']['inp']['old'] for p in perf_data) / len(perf_data)
-                                avg_inp_new = sum(p['coreWebVitals']['inp']['new'] for p in perf_data) / len(perf_data)
-                                
-                                with cwv_col3:
-                                    st.metric("Avg INP", f"{avg_inp_new:.0f}ms", delta=f"{avg_inp_new - avg_inp_old:.0f}ms", delta_color="inverse")
-                    
+                        render_performance_tab(project_id, results)
+
                     with tab3:
-                        if results.get('seoValidation'):
-                            seo_data = results['seoValidation'].get('comparisons', [])[:15]
-                            
-                            if seo_data:
-                                df = pd.DataFrame([
-                                    {
-                                        'URL': s['oldUrl'][:40] + '...' if len(s['oldUrl']) > 40 else s['oldUrl'],
-                                        'Match Score': s['matchScore'],
-                                        'Severity': s['severity']
-                                    }
-                                    for s in seo_data
-                                ])
-                                
-                                fig = px.bar(
-                                    df,
-                                    x='URL',
-                                    y='Match Score',
-                                    color='Match Score',
-                                    color_continuous_scale='RdYlGn',
-                                    range_color=[0, 100],
-                                    title="SEO Match Scores (Top 15 URLs)",
-                                    text='Match Score'
-                                )
-                                fig.update_layout(
-                                    xaxis_tickangle=-45,
-                                    height=500
-                                )
-                                fig.update_traces(texttemplate='%{text:.0f}', textposition='outside')
-                                st.plotly_chart(fig, use_container_width=True)
-                                
-                                # Summary stats
-                                perfect = sum(1 for s in seo_data if s['matchScore'] >= 95)
-                                good = sum(1 for s in seo_data if 80 <= s['matchScore'] < 95)
-                                needs_work = sum(1 for s in seo_data if s['matchScore'] < 80)
-                                
-                                sum_col1, sum_col2, sum_col3 = st.columns(3)
-                                with sum_col1:
-                                    st.metric("Perfect Matches", f"{perfect}/{len(seo_data)}")
-                                with sum_col2:
-                                    st.metric("Good Matches", f"{good}/{len(seo_data)}")
-                                with sum_col3:
-                                    st.metric("Needs Work", f"{needs_work}/{len(seo_data)}")
-                    
+                        render_seo_tab(project_id, results)
+
                     with tab4:
-                        if results.get('mobileResponsiveness'):
-                            mobile_data = results['mobileResponsiveness']['summary']
-                            
-                            comparison_data = {
-                                'Category': ['Fully Responsive', 'Minor Issues', 'Major Issues'],
-                                'Old Site': [
-                                    mobile_data['old'].get('fullyResponsive', 0),
-                                    mobile_data['old'].get('hasMinorIssues', 0),
-                                    mobile_data['old'].get('hasMajorIssues', 0)
-                                ],
-                                'New Site': [
-                                    mobile_data['new'].get('fullyResponsive', 0),
-                                    mobile_data['new'].get('hasMinorIssues', 0),
-                                    mobile_data['new'].get('hasMajorIssues', 0)
-                                ]
-                            }
-                            
-                            fig = go.Figure()
-                            fig.add_trace(go.Bar(
-                                name='Old Site',
-                                x=comparison_data['Category'],
-                                y=comparison_data['Old Site'],
-                                marker_color='#ef4444',
-                                text=comparison_data['Old Site'],
-                                textposition='outside'
-                            ))
-                            fig.add_trace(go.Bar(
-                                name='New Site',
-                                x=comparison_data['Category'],
-                                y=comparison_data['New Site'],
-                                marker_color='#10b981',
-                                text=comparison_data['New Site'],
-                                textposition='outside'
-                            ))
-                            fig.update_layout(
-                                title="Mobile Responsiveness Comparison",
-                                barmode='group',
-                                height=400
-                            )
-                            st.plotly_chart(fig, use_container_width=True)
-                            
-                            # Mobile insights
-                            st.markdown("#### Mobile Insights")
-                            if mobile_data.get('improved', 0) > 0:
-                                st.success(f"✅ {mobile_data['improved']} pages improved in mobile responsiveness")
-                            if mobile_data.get('regressed', 0) > 0:
-                                st.warning(f"⚠️ {mobile_data['regressed']} pages regressed in mobile responsiveness")
+                        render_mobile_tab(project_id, results)
                     
                     st.markdown("---")
                     
@@ -610,46 +1011,45 @@ elif page == "📊 View Results":
                             url_tab1, url_tab2, url_tab3 = st.tabs(["Matched", "Missing", "Redirected"])
                             
                             with url_tab1:
-                                matched = results['urlComparison'].get('matched', [])[:100]
-                                if matched:
-                                    df = pd.DataFrame(matched)
-                                    st.dataframe(df[['oldUrl', 'newUrl']], use_container_width=True)
+                                matched_df = get_url_comparison_df(project_id, 'matched')
+                                if not matched_df.empty:
+                                    # Ship one page of rows per rerun instead of
+                                    # Arrow-serializing a 100-row block each time
+                                    page_size = 25
+                                    page_count = math.ceil(len(matched_df) / page_size)
+                                    page_num = 1
+                                    if page_count > 1:
+                                        page_num = st.number_input(
+                                            "Page", 1, page_count, 1, key='matched_page'
+                                        )
+                                    start = (page_num - 1) * page_size
+                                    st.dataframe(
+                                        matched_df[['oldUrl', 'newUrl']].iloc[start:start + page_size],
+                                        use_container_width=True
+                                    )
+                                    st.caption(f"Page {page_num} of {page_count} · {len(matched_df):,} matched URLs")
                                 else:
                                     st.info("No matched URLs")
-                            
+
                             with url_tab2:
-                                missing = results['urlComparison'].get('missing', [])[:50]
-                                if missing:
-                                    df = pd.DataFrame(missing)
-                                    st.dataframe(df, use_container_width=True)
-                                    st.warning(f"⚠️ {len(missing)} URLs are missing - potential 404s!")
+                                missing_df = get_url_comparison_df(project_id, 'missing').head(50)
+                                if not missing_df.empty:
+                                    st.dataframe(missing_df, use_container_width=True)
+                                    st.warning(f"⚠️ {len(missing_df)} URLs are missing - potential 404s!")
                                 else:
                                     st.success("✅ No missing URLs")
-                            
+
                             with url_tab3:
-                                redirected = results['urlComparison'].get('redirected', [])[:50]
-                                if redirected:
-                                    df = pd.DataFrame(redirected)
-                                    st.dataframe(df[['oldUrl', 'newUrl']], use_container_width=True)
+                                redirected_df = get_url_comparison_df(project_id, 'redirected').head(50)
+                                if not redirected_df.empty:
+                                    st.dataframe(redirected_df[['oldUrl', 'newUrl']], use_container_width=True)
                                 else:
                                     st.info("No redirected URLs")
                     
                     with st.expander("🎯 SEO Validation Details", expanded=False):
-                        if results.get('seoValidation'):
-                            seo_comparisons = results['seoValidation'].get('comparisons', [])[:50]
-                            if seo_comparisons:
-                                df = pd.DataFrame([
-                                    {
-                                        'URL': c['oldUrl'],
-                                        'Match Score': f"{c['matchScore']}%",
-                                        'Title Match': '✅' if c['title']['match'] else '❌',
-                                        'Desc Match': '✅' if c['description']['match'] else '❌',
-                                        'H1 Match': '✅' if c['h1']['match'] else '❌',
-                                        'Severity': c['severity']
-                                    }
-                                    for c in seo_comparisons
-                                ])
-                                st.dataframe(df, use_container_width=True)
+                        seo_details_df = get_seo_details_df(project_id)
+                        if not seo_details_df.empty:
+                            st.dataframe(seo_details_df, use_container_width=True)
                     
                     st.markdown("---")
                     
@@ -657,29 +1057,50 @@ elif page == "📊 View Results":
                     st.markdown("## 📥 Export Reports")
                     
                     export_col1, export_col2, export_col3 = st.columns(3)
-                    
-                    with export_col1:
-                        csv_url = f"{API_BASE_URL}/migration-projects/{project_id}/export?format=csv&section=all"
-                        st.markdown(f"[📄 Download Full CSV Report]({csv_url})")
-                    
-                    with export_col2:
-                        json_url = f"{API_BASE_URL}/migration-projects/{project_id}/export?format=json&section=all"
-                        st.markdown(f"[📊 Download JSON Report]({json_url})")
-                    
-                    with export_col3:
-                        seo_csv_url = f"{API_BASE_URL}/migration-projects/{project_id}/export?format=csv&section=seo"
-                        st.markdown(f"[🎯 Download SEO Report (CSV)]({seo_csv_url})")
+
+                    # Export generation is a heavy backend call, so each
+                    # report is fetched only on an explicit Prepare click;
+                    # the download_button then serves the stashed bytes
+                    # without navigating away or refetching
+                    export_specs = [
+                        (export_col1, "📄 Full CSV Report", 'csv', 'all', 'text/csv'),
+                        (export_col2, "📊 JSON Report", 'json', 'all', 'application/json'),
+                        (export_col3, "🎯 SEO Report (CSV)", 'csv', 'seo', 'text/csv')
+                    ]
+                    for col, name, fmt, section, mime in export_specs:
+                        with col:
+                            export_key = f'export_{project_id}_{fmt}_{section}'
+                            if export_key not in st.session_state:
+                                if st.button(f"⚙️ Prepare {name}", key=f'prepare_{export_key}',
+                                             use_container_width=True):
+                                    try:
+                                        st.session_state[export_key] = get_export(project_id, fmt, section)
+                                    except requests.RequestException as e:
+                                        st.error(f"Export unavailable: {e}")
+                            if export_key in st.session_state:
+                                st.download_button(
+                                    f"📥 Download {name}",
+                                    st.session_state[export_key],
+                                    file_name=f"{project_id}-{section}.{fmt}",
+                                    mime=mime,
+                                    use_container_width=True
+                                )
                 
                 else:
                     st.error(f"Failed to load results: {results_response['error']}")
             
             elif status['status'] == 'processing':
+                # Poll on a fixed cadence while the job runs; once the status
+                # leaves 'processing' this branch is skipped and polling stops.
+                # Bust the status cache so the next poll sees fresh progress —
+                # each poll is one /status GET, results are never touched.
+                # limit caps a forgotten tab at ~50 minutes of polling.
+                fetch_status.clear()
+                st_autorefresh(interval=15_000, limit=200, key=f'poll_{project_id}')
+
                 st.info("⏳ Analysis in progress. This typically takes 15-25 minutes.")
                 st.markdown(f"**Current stage**: {status['processingStatus']['stage'].replace('_', ' ').title()}")
-                
-                if st.button("🔄 Refresh Status"):
-                    st.rerun()
-                
+
                 st.markdown("---")
                 st.markdown("### Processing Steps:")
                 st.markdown("""
@@ -691,6 +1112,10 @@ elif page == "📊 View Results":
                 6. ⏳ Check mobile responsiveness
                 7. ⏳ Generate reports
                 """)
+
+                # Nothing below this branch matters while processing; skip the
+                # rest of the script so each poll stays cheap
+                st.stop()
             
             elif status['status'] == 'failed':
                 st.error("❌ Processing failed. Please try creating a new project.")
@@ -706,18 +1131,46 @@ elif page == "📊 View Results":
 # PROJECTS LIST PAGE
 # ==========================================
 elif page == "📋 Projects List":
+    import pandas as pd
+
     st.markdown('<p class="main-header">All Migration Projects</p>', unsafe_allow_html=True)
-    
-    st.info("💡 Feature coming soon: This will list all your migration projects with quick access to results.")
-    
-    st.markdown("""
-    ### Planned Features:
-    - View all projects with status
-    - Quick search and filter
-    - Delete old projects
-    - Compare multiple projects
-    - Export batch reports
-    """)
+
+    if st.button("🔄 Refresh List"):
+        api_get_cached.clear()
+
+    list_response = api_get_cached('migration-projects')
+
+    if list_response['success']:
+        projects = list_response['data'].get('projects', [])
+
+        if projects:
+            # One batched status call instead of one request per project row
+            ids = [p['_id'] for p in projects[:100]]
+            batch_response = api_request(
+                'migration-projects/status-batch',
+                method='POST',
+                data=orjson.dumps({'ids': ids}),
+                headers={'Content-Type': 'application/json'}
+            )
+            statuses = batch_response['data'] if batch_response['success'] else {}
+
+            df = pd.DataFrame([
+                {
+                    'Project ID': p['_id'],
+                    'Name': p.get('projectName', 'N/A'),
+                    'Old Site': p.get('oldBaseUrl', 'N/A'),
+                    'New Site': p.get('newBaseUrl', 'N/A'),
+                    'Status': statuses.get(p['_id'], {}).get('status', 'unknown')
+                }
+                for p in projects
+            ])
+            st.dataframe(df, use_container_width=True)
+            st.caption("Copy a Project ID into the 📊 View Results page to see its full report.")
+        else:
+            st.info("No projects yet. Create one from the ➕ New Project page.")
+    else:
+        st.error(f"❌ {list_response['error']}")
+        st.info("Please ensure the backend is running and reachable.")
 
 # Footer
 st.markdown("---")